@@ -1,11 +1,38 @@
 import os
 import sys
 import argparse
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
-from PIL import Image, ImageTk
+import ctypes
+import shutil
+import subprocess
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import numpy as np
+from PIL import Image
 from typing import Tuple, Optional, Dict
 
+try:
+    import numba
+    from numba import prange
+except ImportError:  # Numba is optional; NumPy path is used without it
+    numba = None
+
+
+def _load_native_kernel():
+    """Load the optional compiled kernel (see _unpackorm.c for build steps)."""
+    libname = "_unpackorm.dll" if sys.platform.startswith("win") else "_unpackorm.so"
+    try:
+        lib = ctypes.CDLL(os.path.join(os.path.dirname(os.path.abspath(__file__)), libname))
+    except OSError:
+        return None
+    fn = lib.extract_orm
+    fn.argtypes = [ctypes.c_void_p] + [ctypes.c_int] * 8 + [ctypes.c_void_p] * 4
+    fn.restype = None
+    return fn
+
+
+# Kernel preference: C extension -> Numba -> plain NumPy
+_native_extract = _load_native_kernel()
+
 SUPPORTED_EXTS = (".png", ".jpg", ".jpeg", ".tga", ".tif", ".tiff")
 
 # -----------------------------
@@ -15,6 +42,9 @@ SUPPORTED_EXTS = (".png", ".jpg", ".jpeg", ".tga", ".tif", ".tiff")
 def load_image_rgb_or_rgba(path: str) -> Image.Image:
     """Load an image, preserving alpha if present; convert color to RGB(A)."""
     img = Image.open(path)
+    # Let libjpeg pick its fastest full-size decode path; no-op for PNG/TGA/TIFF
+    if img.format == "JPEG":
+        img.draft("RGB", img.size)
     # Convert paletted to RGBA if needed
     if img.mode in ("P", "LA"):
         img = img.convert("RGBA")
@@ -34,23 +64,134 @@ PRESETS: Dict[str, Tuple[str, str, str]] = {
 }
 
 
-def channel_by_letter(img: Image.Image, letter: str) -> Image.Image:
-    r, g, b = img.split()[:3]
-    return {"R": r, "G": g, "B": b}[letter]
+# Letter -> channel axis in the HxWxC uint8 array from np.asarray(img)
+CHANNEL_AXES: Dict[str, int] = {"R": 0, "G": 1, "B": 2}
+
+
+# PNG zlib levels offered in the GUI; level 1 is ~4-6x less deflate CPU
+# than PIL's default 6, and intermediate PBR maps get re-encoded by the
+# engine on import anyway, so the small file-size cost is irrelevant.
+PNG_LEVELS: Dict[str, int] = {"Fast": 1, "Balanced": 6, "Small": 9}
 
 
-def maybe_invert(ch: Image.Image, do_invert: bool) -> Image.Image:
-    if not do_invert:
-        return ch
-    # Invert grayscale channel
-    return Image.eval(ch, lambda px: 255 - px)
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _extract_channels(src, idx_ao, idx_r, idx_m, inv_r, inv_m, out_ao, out_r, out_m, out_h):
+        # Fused channel-pick + optional invert (+ alpha copy) in one parallel
+        # pass, so the interleaved source row is read once instead of once
+        # per output. out_h may be None when no height map is wanted.
+        H, W = src.shape[0], src.shape[1]
+        for y in prange(H):
+            for x in range(W):
+                out_ao[y, x] = src[y, x, idx_ao]
+                v = src[y, x, idx_r]
+                out_r[y, x] = 255 - v if inv_r else v
+                v = src[y, x, idx_m]
+                out_m[y, x] = 255 - v if inv_m else v
+                if out_h is not None:
+                    out_h[y, x] = src[y, x, 3]
 
 
-def save_grayscale(ch: Image.Image, out_path: str) -> None:
-    # Ensure single-channel L mode
-    if ch.mode != "L":
-        ch = ch.convert("L")
-    ch.save(out_path)
+# Per-process output buffers keyed by (H, W), reused across a batch so
+# same-sized textures (the common case: whole 4K material sets) never
+# re-allocate or re-fault the three output planes.
+_BUF_CACHE: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+
+def _batch_buffers(shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    bufs = _BUF_CACHE.get(shape)
+    if bufs is None:
+        bufs = tuple(np.empty(shape, np.uint8) for _ in range(3))
+        _BUF_CACHE[shape] = bufs
+    return bufs
+
+
+def _pick_channels(arr: np.ndarray, ao_i: int, r_i: int, m_i: int,
+                   inv_r: bool, inv_m: bool,
+                   out: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+                   want_height: bool = False,
+                   ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """Extract the output planes from an HxWxC uint8 array.
+
+    Returns (ao, rough, metal, height); height is None unless want_height
+    (which requires a 4-channel source). With out=(ao, rough, metal)
+    buffers, those three results are written in place and no new arrays
+    are allocated for them.
+    """
+    h, w = arr.shape[:2]
+    if _native_extract is not None or numba is not None:
+        if out is not None:
+            ao, rough, metal = out
+        else:
+            ao = np.empty((h, w), np.uint8)
+            rough = np.empty((h, w), np.uint8)
+            metal = np.empty((h, w), np.uint8)
+        # Height rides along in the same fused pass: the source row is
+        # already in cache, so the fourth write is nearly free.
+        height = np.empty((h, w), np.uint8) if want_height else None
+        if _native_extract is not None:
+            src = np.ascontiguousarray(arr)
+            _native_extract(
+                src.ctypes.data, h, w, src.shape[2], ao_i, r_i, m_i,
+                int(inv_r), int(inv_m),
+                ao.ctypes.data, rough.ctypes.data, metal.ctypes.data,
+                height.ctypes.data if height is not None else None,
+            )
+        else:
+            _extract_channels(arr, ao_i, r_i, m_i, inv_r, inv_m, ao, rough, metal, height)
+        return ao, rough, metal, height
+    # In the NumPy paths the alpha plane is a zero-copy view; no extra pass.
+    height = arr[..., 3] if want_height else None
+    if out is not None:
+        ao_buf, r_buf, m_buf = out
+        np.copyto(ao_buf, arr[..., ao_i])
+        if inv_r:
+            np.bitwise_not(arr[..., r_i], out=r_buf)
+        else:
+            np.copyto(r_buf, arr[..., r_i])
+        if inv_m:
+            np.bitwise_not(arr[..., m_i], out=m_buf)
+        else:
+            np.copyto(m_buf, arr[..., m_i])
+        return ao_buf, r_buf, m_buf, height
+    # One HWC->CHW copy up front: interleaved channel slices touch 3-4x more
+    # cache lines than needed, so pay for a planar layout once and every
+    # later per-channel op (invert, PNG encode) walks contiguous stride-1 data.
+    planes = np.ascontiguousarray(arr.transpose(2, 0, 1))
+    # For uint8, ~x == 255 - x. Invert in place on our own copy so the
+    # common no-invert case hands out zero-copy views with no extra pass.
+    if inv_r:
+        np.bitwise_not(planes[r_i], out=planes[r_i])
+    if inv_m:
+        np.bitwise_not(planes[m_i], out=planes[m_i])
+    height = planes[3] if want_height else None
+    return planes[ao_i], planes[r_i], planes[m_i], height
+
+
+def save_grayscale(ch: np.ndarray, out_path: str, compress_level: int = 1) -> None:
+    Image.fromarray(ch, mode="L").save(
+        out_path, format="PNG", compress_level=compress_level, optimize=False
+    )
+
+
+# Pillow's PNG encoder releases the GIL inside libpng/zlib, so the 3-4
+# writes per image can run concurrently. One pool per process, made lazily.
+_SAVE_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _save_pool() -> ThreadPoolExecutor:
+    global _SAVE_POOL
+    if _SAVE_POOL is None:
+        _SAVE_POOL = ThreadPoolExecutor(max_workers=4)
+    return _SAVE_POOL
+
+
+def _resolve_preset(preset_name: str) -> Tuple[int, int, int]:
+    """Resolve a preset name to (ao, roughness, metallic) channel axes once."""
+    if preset_name not in PRESETS:
+        raise ValueError(f"Unknown preset: {preset_name}")
+    ao_from, rough_from, metal_from = PRESETS[preset_name]
+    return CHANNEL_AXES[ao_from], CHANNEL_AXES[rough_from], CHANNEL_AXES[metal_from]
 
 
 def unpack_orm(
@@ -60,52 +201,165 @@ def unpack_orm(
     invert_roughness: bool = False,
     invert_metallic: bool = False,
     export_alpha_as_height: bool = False,
-) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    compress_level: int = 1,
+    return_arrays: bool = False,
+    out_buffers: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    output_format: str = "png",
+    _dir_ready: bool = False,
+):
     """
     Unpack an ORM-like packed texture to grayscale AO / Roughness / Metallic (and optional Height from Alpha).
 
     Returns tuple of saved file paths: (ao, roughness, metallic, height)
     Missing outputs return as None.
+
+    output_format="tiff" writes one multi-page LZW TIFF (pages: AO,
+    Roughness, Metallic[, Height]) instead of separate PNGs — one file
+    handle and one zlib-free stream instead of three; the combined path
+    is returned in the first slot.
+
+    With return_arrays=True, also returns the in-memory uint8 channel
+    arrays as a second value ({"ao": ..., "r": ..., "m": ...}) so callers
+    (e.g. the GUI preview) can skip re-reading the just-written PNGs.
+
+    This is the friendly string-based API; batch loops resolve the preset
+    once and call _unpack_orm_fast directly.
     """
-    if not os.path.exists(output_dir):
+    ao_i, r_i, m_i = _resolve_preset(preset_name)
+    return _unpack_orm_fast(
+        input_path, output_dir, ao_i, r_i, m_i,
+        invert_roughness=invert_roughness,
+        invert_metallic=invert_metallic,
+        export_alpha_as_height=export_alpha_as_height,
+        compress_level=compress_level,
+        return_arrays=return_arrays,
+        out_buffers=out_buffers,
+        output_format=output_format,
+        _dir_ready=_dir_ready,
+    )
+
+
+def _unpack_orm_fast(
+    input_path: str,
+    output_dir: str,
+    ao_i: int,
+    r_i: int,
+    m_i: int,
+    invert_roughness: bool = False,
+    invert_metallic: bool = False,
+    export_alpha_as_height: bool = False,
+    compress_level: int = 1,
+    return_arrays: bool = False,
+    out_buffers: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    output_format: str = "png",
+    _dir_ready: bool = False,
+):
+    """unpack_orm body taking pre-resolved channel axes; no string handling."""
+    # Callers that process many images create the directory once up front
+    # and pass _dir_ready=True so batch loops never re-stat it.
+    if not _dir_ready:
         os.makedirs(output_dir, exist_ok=True)
 
-    img = load_image_rgb_or_rgba(input_path)
-
     base = os.path.splitext(os.path.basename(input_path))[0]
     ao_path = os.path.join(output_dir, f"{base}_AO.png")
     rough_path = os.path.join(output_dir, f"{base}_Roughness.png")
     metal_path = os.path.join(output_dir, f"{base}_Metallic.png")
     height_path = os.path.join(output_dir, f"{base}_Height.png")
 
-    # Pick channels by preset
-    if preset_name not in PRESETS:
-        raise ValueError(f"Unknown preset: {preset_name}")
-    ao_from, rough_from, metal_from = PRESETS[preset_name]
-
-    ao_ch = channel_by_letter(img, ao_from)
-    rough_ch = maybe_invert(channel_by_letter(img, rough_from), invert_roughness)
-    metal_ch = maybe_invert(channel_by_letter(img, metal_from), invert_metallic)
+    # Degenerate case: a single-channel input "unpacks" into three identical
+    # maps, so skip the whole pipeline and duplicate the data instead.
+    if output_format == "png" and not (invert_roughness or invert_metallic):
+        with Image.open(input_path) as probe:
+            if probe.mode == "L":
+                print(f"Warning: '{input_path}' is already grayscale — unpacking is a no-op; "
+                      "AO/Roughness/Metallic will be identical.")
+                if probe.format == "PNG":
+                    # No decode or re-encode at all, just file copies
+                    shutil.copyfile(input_path, ao_path)
+                else:
+                    save_grayscale(np.asarray(probe), ao_path, compress_level)
+                shutil.copyfile(ao_path, rough_path)
+                shutil.copyfile(ao_path, metal_path)
+                paths = (ao_path, rough_path, metal_path, None)
+                if return_arrays:
+                    g = np.asarray(Image.open(ao_path))
+                    return paths, {"ao": g, "r": g, "m": g}
+                return paths
 
-    save_grayscale(ao_ch, ao_path)
-    save_grayscale(rough_ch, rough_path)
-    save_grayscale(metal_ch, metal_path)
+    img = load_image_rgb_or_rgba(input_path)
+    arr = np.asarray(img)  # H x W x {3,4}, uint8
+
+    want_height = export_alpha_as_height and img.mode == "RGBA"
+    ao_ch, rough_ch, metal_ch, height_ch = _pick_channels(
+        arr, ao_i, r_i, m_i,
+        invert_roughness, invert_metallic, out=out_buffers, want_height=want_height,
+    )
+
+    if output_format == "tiff":
+        tiff_path = os.path.join(output_dir, f"{base}_Maps.tiff")
+        pages = [Image.fromarray(rough_ch, "L"), Image.fromarray(metal_ch, "L")]
+        if want_height:
+            pages.append(Image.fromarray(height_ch, "L"))
+        Image.fromarray(ao_ch, "L").save(
+            tiff_path, save_all=True, append_images=pages, compression="tiff_lzw"
+        )
+        paths = (tiff_path, None, None, None)
+        if return_arrays:
+            return paths, {"ao": ao_ch, "r": rough_ch, "m": metal_ch}
+        return paths
+
+    pool = _save_pool()
+    futures = [
+        pool.submit(save_grayscale, ao_ch, ao_path, compress_level),
+        pool.submit(save_grayscale, rough_ch, rough_path, compress_level),
+        pool.submit(save_grayscale, metal_ch, metal_path, compress_level),
+    ]
 
     saved_height = None
-    if export_alpha_as_height and img.mode == "RGBA":
-        _, _, _, a = img.split()
-        save_grayscale(a, height_path)
+    if want_height:
+        futures.append(pool.submit(save_grayscale, height_ch, height_path, compress_level))
         saved_height = height_path
 
-    return ao_path, rough_path, metal_path, saved_height
+    for fut in futures:
+        fut.result()  # wait for all writes, propagating any encoder error
+
+    paths = (ao_path, rough_path, metal_path, saved_height)
+    if return_arrays:
+        return paths, {"ao": ao_ch, "r": rough_ch, "m": metal_ch}
+    return paths
+
+
+def _unpack_one(task: tuple) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    """Picklable per-image worker for ProcessPoolExecutor batch runs."""
+    input_path, output_dir, ao_i, r_i, m_i, invert_roughness, invert_metallic, export_alpha_as_height, compress_level, output_format = task
+    with Image.open(input_path) as probe:  # header-only read, no decode
+        w, h = probe.size
+    return _unpack_orm_fast(
+        input_path, output_dir, ao_i, r_i, m_i,
+        invert_roughness=invert_roughness,
+        invert_metallic=invert_metallic,
+        export_alpha_as_height=export_alpha_as_height,
+        compress_level=compress_level,
+        out_buffers=_batch_buffers((h, w)),
+        output_format=output_format,
+        _dir_ready=True,
+    )
 
 
 # -----------------------------
 # GUI
 # -----------------------------
 
+def _load_gui_modules():
+    """Import Tk and ImageTk on demand so CLI/batch runs never pay for them."""
+    global tk, filedialog, messagebox, ttk, ImageTk
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, ttk
+    from PIL import ImageTk
+
+
 class UnpackORMApp:
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: "tk.Tk"):
         self.root = root
         root.title("UnpackORM Pro — AO/Roughness/Metallic Extractor")
         root.geometry("610x520")
@@ -118,6 +372,7 @@ class UnpackORMApp:
         self.invert_metal = tk.BooleanVar(value=False)
         self.export_alpha_height = tk.BooleanVar(value=False)
         self.batch_mode = tk.BooleanVar(value=False)
+        self.png_level = tk.StringVar(value="Fast")
 
         self.build_ui()
         self.preview_images = {}  # cache to keep references
@@ -156,6 +411,9 @@ class UnpackORMApp:
         ttk.Checkbutton(frm_opts, text="Invert Metallic", variable=self.invert_metal).grid(row=1, column=1, sticky="w", pady=(6,0))
         ttk.Checkbutton(frm_opts, text="Export Alpha as Height (if present)", variable=self.export_alpha_height).grid(row=2, column=0, sticky="w", pady=(6,0))
 
+        ttk.Label(frm_opts, text="PNG Compression").grid(row=3, column=0, sticky="w", pady=(6,0))
+        ttk.Combobox(frm_opts, textvariable=self.png_level, values=list(PNG_LEVELS.keys()), state="readonly", width=12).grid(row=3, column=1, sticky="w", pady=(6,0))
+
         # Actions
         frm_actions = ttk.Frame(self.root)
         frm_actions.pack(fill="x", **pad)
@@ -197,9 +455,11 @@ class UnpackORMApp:
             if sys.platform.startswith("win"):
                 os.startfile(path)  # type: ignore[attr-defined]
             elif sys.platform == "darwin":
-                os.system(f"open '{path}'")
+                subprocess.Popen(["open", path])
             else:
-                os.system(f"xdg-open '{path}'")
+                subprocess.Popen(["xdg-open", path])
+        except FileNotFoundError:
+            messagebox.showerror("Open Folder", "No file manager found to open the folder.")
         except Exception as e:
             messagebox.showerror("Open Folder", f"Failed to open folder:\n{e}")
 
@@ -209,7 +469,7 @@ class UnpackORMApp:
                 if os.path.splitext(name)[1].lower() in SUPPORTED_EXTS:
                     yield os.path.join(root_dir, name)
 
-    def process_single(self, in_path: str, out_dir: str) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    def process_single(self, in_path: str, out_dir: str, return_arrays: bool = False):
         return unpack_orm(
             input_path=in_path,
             output_dir=out_dir,
@@ -217,6 +477,9 @@ class UnpackORMApp:
             invert_roughness=self.invert_rough.get(),
             invert_metallic=self.invert_metal.get(),
             export_alpha_as_height=self.export_alpha_height.get(),
+            compress_level=PNG_LEVELS[self.png_level.get()],
+            return_arrays=return_arrays,
+            _dir_ready=True,
         )
 
     def process_texture(self):
@@ -226,6 +489,7 @@ class UnpackORMApp:
             messagebox.showwarning("Missing Information", "Please select both an input path and an output folder.")
             return
 
+        os.makedirs(output_dir, exist_ok=True)
         try:
             saved_any = False
             first_preview_set = False
@@ -233,25 +497,33 @@ class UnpackORMApp:
                 if not os.path.isdir(input_sel):
                     messagebox.showerror("Batch Mode", "In batch mode, the input must be a folder.")
                     return
-                count = 0
-                for img_path in self.iter_images_in_folder(input_sel):
-                    ao, rr, mm, hh = self.process_single(img_path, output_dir)
-                    saved_any = True
-                    count += 1
-                    if not first_preview_set:
-                        self.update_preview(ao, rr, mm)
-                        first_preview_set = True
-                if count == 0:
+                ao_i, r_i, m_i = _resolve_preset(self.preset.get())
+                tasks = [
+                    (img_path, output_dir, ao_i, r_i, m_i, self.invert_rough.get(),
+                     self.invert_metal.get(), self.export_alpha_height.get(),
+                     PNG_LEVELS[self.png_level.get()], "png")
+                    for img_path in self.iter_images_in_folder(input_sel)
+                ]
+                if not tasks:
                     messagebox.showinfo("No Images", "No supported images found in that folder.")
                     return
+                count = 0
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+                    for fut in as_completed([ex.submit(_unpack_one, t) for t in tasks]):
+                        ao, rr, mm, hh = fut.result()
+                        saved_any = True
+                        count += 1
+                        if not first_preview_set:
+                            self.update_preview(ao, rr, mm)
+                            first_preview_set = True
                 messagebox.showinfo("Success", f"Processed {count} image(s). Files saved to:\n{output_dir}")
             else:
                 if not os.path.isfile(input_sel):
                     messagebox.showerror("Input", "Input path is not a file.")
                     return
-                ao, rr, mm, hh = self.process_single(input_sel, output_dir)
+                (ao, rr, mm, hh), arrays = self.process_single(input_sel, output_dir, return_arrays=True)
                 saved_any = True
-                self.update_preview(ao, rr, mm)
+                self.update_preview(ao, rr, mm, arrays)
                 parts = [p for p in (ao, rr, mm, hh) if p]
                 messagebox.showinfo("Success", "Saved:\n- " + "\n- ".join(parts))
 
@@ -261,21 +533,37 @@ class UnpackORMApp:
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred:\n{e}")
 
-    def update_preview(self, ao_path: Optional[str], rough_path: Optional[str], metal_path: Optional[str]):
+    def update_preview(self, ao_path: Optional[str], rough_path: Optional[str], metal_path: Optional[str],
+                       arrays: Optional[Dict[str, np.ndarray]] = None):
         # Clear canvas
         self.canvas_prev.delete("all")
         if not (ao_path and rough_path and metal_path):
             self.canvas_prev.create_text(280, 120, text="Preview unavailable.", fill="#dddddd")
             return
 
+        def thumb_from_array(arr):
+            # frombuffer wraps the pixel data directly, skipping fromarray's
+            # stride checks and potential copy; we only resize from it.
+            arr = np.ascontiguousarray(arr)
+            h, w = arr.shape
+            img = Image.frombuffer("L", (w, h), arr, "raw", "L", 0, 1)
+            return ImageTk.PhotoImage(img.resize((170, 170), Image.LANCZOS))
+
         def load_thumb(p):
             img = Image.open(p).convert("L")
             img = img.resize((170, 170), Image.LANCZOS)
             return ImageTk.PhotoImage(img)
 
-        self.preview_images["ao"] = load_thumb(ao_path)
-        self.preview_images["r"] = load_thumb(rough_path)
-        self.preview_images["m"] = load_thumb(metal_path)
+        if arrays is not None:
+            # Thumbnails straight from the in-memory channels; no disk round-trip
+            self.preview_images["ao"] = thumb_from_array(arrays["ao"])
+            self.preview_images["r"] = thumb_from_array(arrays["r"])
+            self.preview_images["m"] = thumb_from_array(arrays["m"])
+        else:
+            # Fallback: re-read the written files (batch mode, existing files)
+            self.preview_images["ao"] = load_thumb(ao_path)
+            self.preview_images["r"] = load_thumb(rough_path)
+            self.preview_images["m"] = load_thumb(metal_path)
 
         # Draw side by side
         x0, y0 = 90, 40
@@ -304,6 +592,10 @@ def run_cli():
     parser.add_argument("--invert-metal", action="store_true", help="Invert the metallic channel")
     parser.add_argument("--alpha-as-height", action="store_true", help="Export alpha channel as Height if present")
     parser.add_argument("--batch", action="store_true", help="Treat input as a folder and process images recursively")
+    parser.add_argument("--png-level", type=int, default=1, choices=range(0, 10), metavar="0-9",
+                        help="PNG zlib compression level (1=fast default, 6=PIL default, 9=smallest)")
+    parser.add_argument("--format", choices=["png", "tiff"], default="png", dest="output_format",
+                        help="Output format: separate PNGs (default) or one multi-page LZW TIFF per input")
 
     args = parser.parse_args()
 
@@ -314,20 +606,19 @@ def run_cli():
     os.makedirs(args.out, exist_ok=True)
 
     if args.batch:
-        count = 0
+        ao_i, r_i, m_i = _resolve_preset(args.preset)
+        tasks = []
         for root_dir, _, files in os.walk(args.input):
             for name in files:
                 if os.path.splitext(name)[1].lower() in SUPPORTED_EXTS:
                     in_path = os.path.join(root_dir, name)
-                    unpack_orm(
-                        input_path=in_path,
-                        output_dir=args.out,
-                        preset_name=args.preset,
-                        invert_roughness=args.invert_rough,
-                        invert_metallic=args.invert_metal,
-                        export_alpha_as_height=args.alpha_as_height,
-                    )
-                    count += 1
+                    tasks.append((in_path, args.out, ao_i, r_i, m_i, args.invert_rough,
+                                  args.invert_metal, args.alpha_as_height, args.png_level,
+                                  args.output_format))
+        count = 0
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            for _ in ex.map(_unpack_one, tasks, chunksize=8):
+                count += 1
         print(f"Processed {count} images → {args.out}")
     else:
         if not os.path.isfile(args.input):
@@ -340,15 +631,21 @@ def run_cli():
             invert_roughness=args.invert_rough,
             invert_metallic=args.invert_metal,
             export_alpha_as_height=args.alpha_as_height,
+            compress_level=args.png_level,
+            output_format=args.output_format,
+            _dir_ready=True,
         )
         print("Saved:\n- " + "\n- ".join([p for p in paths if p]))
 
 
 if __name__ == "__main__":
+    if sys.platform.startswith("win"):
+        mp.set_start_method("spawn", force=True)
     # If run with arguments, act as CLI; otherwise, show GUI
     if len(sys.argv) > 1 and any(a.startswith("-") for a in sys.argv[1:]):
         run_cli()
     else:
+        _load_gui_modules()
         root = tk.Tk()
         # Use themed widgets
         try:
@@ -0,0 +1,54 @@
+/* Fused channel extract + optional invert kernel for UnpackORM.
+ *
+ * Optional native alternative to the Numba kernel with no LLVM dependency.
+ * Drop the compiled library next to UnpackORM.py and it is picked up
+ * automatically (see _load_native_kernel in UnpackORM.py).
+ *
+ * Build:
+ *   Linux/macOS:  cc -O3 -mavx2 -fopenmp -shared -fPIC _unpackorm.c -o _unpackorm.so
+ *                 (use -msse4 instead of -mavx2 on older CPUs)
+ *   Windows MSVC: cl /O2 /arch:AVX2 /openmp /LD _unpackorm.c /Fe:_unpackorm.dll
+ */
+#include <stddef.h>
+#include <stdint.h>
+
+#ifdef _WIN32
+#define EXPORT __declspec(dllexport)
+#else
+#define EXPORT
+#endif
+
+/* src is an interleaved HxWxC uint8 image (C = 3 or 4); ao/r/m (and h,
+ * which may be NULL) are HxW uint8 planes. One pass over the source:
+ * the row is read once and all planes are written from it. */
+EXPORT void extract_orm(const uint8_t *src, int H, int W, int C,
+                        int idx_ao, int idx_r, int idx_m,
+                        int inv_r, int inv_m,
+                        uint8_t *ao, uint8_t *r, uint8_t *m, uint8_t *h)
+{
+    const uint8_t r_mask = inv_r ? 0xff : 0x00; /* x ^ 0xff == 255 - x */
+    const uint8_t m_mask = inv_m ? 0xff : 0x00;
+#ifdef _OPENMP
+#pragma omp parallel for schedule(static)
+#endif
+    for (int y = 0; y < H; y++) {
+        const uint8_t *row = src + (size_t)y * W * C;
+        uint8_t *ao_row = ao + (size_t)y * W;
+        uint8_t *r_row = r + (size_t)y * W;
+        uint8_t *m_row = m + (size_t)y * W;
+        uint8_t *h_row = h ? h + (size_t)y * W : NULL;
+#ifdef _OPENMP
+#pragma omp simd
+#endif
+        for (int x = 0; x < W; x++) {
+            const uint8_t *px = row + (size_t)x * C;
+            ao_row[x] = px[idx_ao];
+            r_row[x] = px[idx_r] ^ r_mask;
+            m_row[x] = px[idx_m] ^ m_mask;
+        }
+        if (h_row) {
+            for (int x = 0; x < W; x++)
+                h_row[x] = row[(size_t)x * C + 3];
+        }
+    }
+}